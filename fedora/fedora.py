@@ -135,7 +135,9 @@ class FedoraObject:
         versionable="true",
         datastream_state="A",
         checksum_type="DEFAULT",
-        alt_label=""
+        alt_label="",
+        checksum="",
+        mime_type=""
     ):
         """Adds an internally managed datastream.
         This is not a one to one vesion of addDatastream.  It has been stripped down to fit one use case: internally
@@ -147,6 +149,9 @@ class FedoraObject:
             versionable (str): Defaults to "true".  Specifies whether the datastream should have versioning ("true" or "false").
             datastream_state (str): Specify whether the datastream is active, inactive, or deleted.
             checksum_type (str): The checksum type to use.  Defaults to "DEFAULT". See API docs for options.
+            alt_label (str): The label of the datastream.  Defaults to the dsid.
+            checksum (str): A precomputed checksum for Fedora to verify against checksum_type.  Optional.
+            mime_type (str): The mime type of the file.  Detected from the file if not specified.
         Returns:
             int: The http status code of the request.
         Examples:
@@ -168,13 +173,15 @@ class FedoraObject:
             )
         if alt_label == "":
             alt_label = dsid
-        mime = magic.Magic(mime=True)
+        if mime_type == "":
+            mime_type = magic.Magic(mime=True).from_file(file)
         upload_file = {
-            "file": (file, open(file, "rb"), mime.from_file(file), {"Expires": "0"})
+            "file": (file, open(file, "rb"), mime_type, {"Expires": "0"})
         }
         r = requests.post(
             f"{self.fedora_url}/fedora/objects/{pid}/datastreams/{dsid}/?controlGroup=M&dsLabel={alt_label}&versionable="
-            f"{versionable}&dsState={datastream_state}&checksumType={checksum_type}",
+            f"{versionable}&dsState={datastream_state}&checksumType={checksum_type}"
+            f"{f'&checksum={checksum}' if checksum != '' else ''}",
             auth=self.auth,
             files=upload_file,
         )
@@ -0,0 +1,94 @@
+from pipeline.pipeline import IngestPipeline
+from argparse import ArgumentParser
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Ingest the compound objects in a CSV or YAML manifest into Fedora. A YAML manifest can be a "
+        "list of rows or one row per --- separated document."
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        dest="manifest",
+        help="Specify the path to your manifest.",
+        required=True,
+    )
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        dest="namespace",
+        help="Specify the namespace for rows that do not have one.",
+    )
+    parser.add_argument(
+        "-c",
+        "--collection",
+        dest="collection",
+        help="Specify the collection for rows that do not have one.",
+    )
+    parser.add_argument(
+        "-p",
+        "--policy",
+        dest="policy",
+        help="Specify the policy for rows that do not have one.",
+    )
+    parser.add_argument(
+        "-s",
+        "--saxon",
+        dest="saxon",
+        help="Specify the path to saxon.",
+        default="saxon.jar",
+    )
+    parser.add_argument(
+        "-t",
+        "--transform",
+        dest="transform",
+        help="Specify the path to your MODS to DC transform.",
+        default="transform.xsl",
+    )
+    parser.add_argument(
+        "-o",
+        "--dc_output",
+        dest="dc_output",
+        help="Specify where to write transformed DC.",
+        default="metadata/dc",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        help="Specify the number of threads for each stage.",
+        type=int,
+        default=4,
+    )
+    parser.add_argument(
+        "-q",
+        "--queue_size",
+        dest="queue_size",
+        help="Specify how many objects can wait between stages.",
+        type=int,
+        default=16,
+    )
+    parser.add_argument(
+        "-f",
+        "--fedora",
+        dest="fedora",
+        help="Specify your Fedora url.",
+        default="http://localhost:8080",
+    )
+    args = parser.parse_args()
+    defaults = {
+        key: value for key, value in (
+            ("namespace", args.namespace), ("collection", args.collection), ("policy", args.policy)
+        ) if value is not None
+    }
+    ingested, failed = IngestPipeline(
+        manifest=args.manifest,
+        saxon=args.saxon,
+        transform=args.transform,
+        dc_output=args.dc_output,
+        defaults=defaults,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        fedora=args.fedora,
+    ).run()
+    print(f"Ingested {ingested} objects. {failed} failed.")
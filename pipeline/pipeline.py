@@ -0,0 +1,217 @@
+import csv
+import hashlib
+import os
+import queue
+import subprocess
+import threading
+
+import magic
+import yaml
+
+from fedora.fedora import CompoundObject
+
+
+class IngestPipeline:
+    """Ingests the compound objects described in a manifest through a staged pipeline.
+
+    Each stage runs in its own pool of threads and hands objects to the next stage through a bounded queue, so
+    transforms and hashing overlap with Fedora requests and a full queue stops the manifest from being read further.
+    CSV manifests have one row per line.  YAML manifests can be a list of mappings or a stream of mappings separated
+    by ---.  CSV and --- separated YAML are streamed, so memory stays flat no matter how long the manifest is.
+    """
+    def __init__(
+            self,
+            manifest,
+            saxon="saxon.jar",
+            transform="transform.xsl",
+            dc_output="metadata/dc",
+            defaults=None,
+            workers=4,
+            queue_size=16,
+            fedora="http://localhost:8080",
+            auth=("fedoraAdmin", "fedoraAdmin"),
+    ):
+        self.manifest = manifest
+        self.saxon = saxon
+        self.transform = transform
+        self.dc_output = dc_output
+        self.defaults = {"state": "A"}
+        self.defaults.update(defaults or {})
+        self.workers = workers
+        self.queue_size = queue_size
+        self.fedora = fedora
+        self.auth = auth
+        self.stages = (
+            self.transform_to_dc,
+            self.hash_and_detect_mime,
+            self.create_object,
+            self.upload_datastreams,
+            self.apply_policy,
+        )
+        self.lock = threading.Lock()
+        self.ingested = 0
+        self.failed = 0
+
+    def read_manifest(self):
+        """Yields each row of a CSV or YAML manifest without its empty values."""
+        with open(self.manifest, "r", newline="", encoding="utf-8-sig") as manifest:
+            if self.manifest.endswith((".yml", ".yaml")):
+                rows = self.__flatten(yaml.safe_load_all(manifest))
+            else:
+                rows = csv.DictReader(manifest)
+            for row in rows:
+                if isinstance(row, dict):
+                    row = {key: value for key, value in row.items() if value is not None and value != ""}
+                yield row
+
+    @staticmethod
+    def __flatten(documents):
+        for document in documents:
+            if isinstance(document, list):
+                yield from document
+            elif document is not None:
+                yield document
+
+    def __fail(self, message):
+        with self.lock:
+            self.failed += 1
+        print(message)
+
+    def crawl(self):
+        """Yields one object per MODS file, expanding manifest rows that point to a directory of MODS records.
+
+        Only the .xml files at the top of a directory are crawled.  Generated DC goes to a directory for each row so
+        that MODS records with the same name in different rows never share a DC file.
+        """
+        for number, row in enumerate(self.read_manifest(), start=1):
+            if not isinstance(row, dict):
+                self.__fail(f"Skipped row {number} of {self.manifest}: it is not a mapping.")
+                continue
+            row = {**self.defaults, **row}
+            missing = [key for key in ("mods", "namespace", "collection") if key not in row]
+            if missing:
+                self.__fail(f"Skipped row {number} of {self.manifest}: missing {', '.join(missing)}.")
+                continue
+            if os.path.isdir(row["mods"]):
+                files = [
+                    file for file in sorted(os.listdir(row["mods"]))
+                    if file.endswith(".xml") and os.path.isfile(os.path.join(row["mods"], file))
+                ]
+            else:
+                files = [None]
+            for file in files:
+                item = {**row, "number": number}
+                if file is not None:
+                    item["mods"] = os.path.join(row["mods"], file)
+                    if "dc" in row:
+                        item["dc"] = os.path.join(row["dc"], file)
+                yield item
+
+    def transform_to_dc(self, item):
+        """Transforms MODS to DC with saxon if the manifest did not supply DC."""
+        if "dc" not in item:
+            output = os.path.join(self.dc_output, str(item["number"]))
+            os.makedirs(output, exist_ok=True)
+            item["dc"] = os.path.join(output, os.path.basename(item["mods"]))
+            with open(item["dc"], "wb") as dc:
+                subprocess.run(["java", "-jar", self.saxon, item["mods"], self.transform], stdout=dc, check=True)
+        item["object"] = CompoundObject(
+            mods=item["mods"],
+            dc=item["dc"],
+            namespace=item["namespace"],
+            collection=item["collection"],
+            state=item["state"],
+            fedora=self.fedora,
+            auth=self.auth,
+        )
+        return item
+
+    def hash_and_detect_mime(self, item):
+        """Computes the SHA-256 and mime type of each file that will be uploaded."""
+        mime = magic.Magic(mime=True)
+        item["files"] = {}
+        for dsid, key in (("MODS", "mods"), ("DC", "dc"), ("POLICY", "policy")):
+            if key in item:
+                sha256 = hashlib.sha256()
+                with open(item[key], "rb") as file:
+                    for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                        sha256.update(chunk)
+                item["files"][dsid] = (item[key], sha256.hexdigest(), mime.from_file(item[key]))
+        return item
+
+    def create_object(self, item):
+        """Creates the compound object and adds it to its collection."""
+        compound = item["object"]
+        item["pid"] = compound.ingest(compound.namespace, compound.label, compound.state)
+        compound.add_to_collection(item["pid"])
+        compound.assign_compound_content_model(item["pid"])
+        compound.change_versioning(item["pid"], "RELS-EXT", "true")
+        return item
+
+    @staticmethod
+    def __add_file(item, dsid):
+        path, checksum, mime_type = item["files"][dsid]
+        return item["object"].add_managed_datastream(
+            item["pid"], dsid, path, checksum_type="SHA-256", checksum=checksum, mime_type=mime_type
+        )
+
+    def upload_datastreams(self, item):
+        """Uploads the MODS and DC datastreams."""
+        self.__add_file(item, "MODS")
+        self.__add_file(item, "DC")
+        return item
+
+    def apply_policy(self, item):
+        """Adds a POLICY datastream if the manifest specified one."""
+        if "POLICY" in item["files"]:
+            self.__add_file(item, "POLICY")
+        return item
+
+    def __work(self, stage, inbox, outbox):
+        while True:
+            item = inbox.get()
+            if item is None:
+                return
+            try:
+                item = stage(item)
+            except Exception as e:
+                pid = item.get("pid")
+                created = f" after creating {pid}" if pid is not None else ""
+                self.__fail(f"Failed to ingest {item['mods']} during {stage.__name__}{created}: {e}")
+                continue
+            if outbox is not None:
+                outbox.put(item)
+            else:
+                with self.lock:
+                    self.ingested += 1
+                print(f"Ingested {item['pid']} from {item['mods']}.")
+
+    def run(self):
+        """Runs every object in the manifest through the pipeline.
+
+        Returns:
+            tuple: The number of objects ingested and the number that failed.
+        Examples:
+            >>> IngestPipeline("manifest.csv").run()
+            (42, 0)
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for stage in self.stages] + [None]
+        pools = []
+        for number, stage in enumerate(self.stages):
+            pool = [
+                threading.Thread(target=self.__work, args=(stage, queues[number], queues[number + 1]))
+                for worker in range(self.workers)
+            ]
+            for thread in pool:
+                thread.start()
+            pools.append(pool)
+        try:
+            for item in self.crawl():
+                queues[0].put(item)
+        finally:
+            for number, pool in enumerate(pools):
+                for thread in pool:
+                    queues[number].put(None)
+                for thread in pool:
+                    thread.join()
+        return self.ingested, self.failed
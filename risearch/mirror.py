@@ -0,0 +1,163 @@
+import sqlite3
+
+from risearch.risearch import ResourceIndexSearch
+
+
+class LocalResourceIndexSearch:
+    """Answers ResourceIndexSearch questions from a local SQLite mirror of the resource index."""
+    def __init__(self, database="risearch.db", remote=None, batch_size=50):
+        self.database = database
+        self.batch_size = batch_size
+        self.remote = remote if remote is not None else ResourceIndexSearch(riformat="JSON")
+        self.connection = sqlite3.connect(database)
+        self.__create_tables()
+
+    def __create_tables(self):
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS triples (
+                subject TEXT, predicate TEXT, object TEXT, UNIQUE (subject, predicate, object)
+            );
+            CREATE INDEX IF NOT EXISTS triples_predicate ON triples (predicate, object);
+            CREATE INDEX IF NOT EXISTS triples_object ON triples (object);
+            CREATE TABLE IF NOT EXISTS syncs (scope TEXT PRIMARY KEY, modified TEXT);
+            """
+        )
+
+    @staticmethod
+    def __scope(namespace, collection):
+        return f"namespace={namespace or ''}&collection={collection or ''}"
+
+    def sync(self, namespace=None, collection=None, since=None):
+        """Copies the relationships of a namespace or collection from the remote resource index.
+
+        The first sync of a scope dumps everything.  After that, only objects modified since the last sync are
+        fetched and their triples replaced.  Mirrored members of a collection and their parts and pages are also
+        checked in batches by pid, so objects that were modified and fell out of the collection are refreshed too.
+        Purged objects are not removed.
+        Args:
+            namespace (str): The namespace to mirror.
+            collection (str): The collection to mirror.
+            since (str): An xsd:dateTime.  Overrides the date of the last sync.
+        Returns:
+            int: The number of objects that were added or refreshed.
+        Examples:
+            >>> LocalResourceIndexSearch().sync(namespace="test")
+            42
+        """
+        scope = self.__scope(namespace, collection)
+        if since is None:
+            last_sync = self.connection.execute(
+                "SELECT modified FROM syncs WHERE scope = ?", (scope,)
+            ).fetchone()
+            since = last_sync[0] if last_sync is not None else None
+        triples = self.remote.get_triples(namespace=namespace, collection=collection, since=since)
+        subjects = {triple[0] for triple in triples}
+        if since is not None and collection is not None:
+            mirrored = sorted(self.__mirrored_members(collection) - subjects)
+            for start in range(0, len(mirrored), self.batch_size):
+                pids = [subject.replace("info:fedora/", "") for subject in mirrored[start:start + self.batch_size]]
+                refreshed = self.remote.get_triples(since=since, pids=pids)
+                triples += refreshed
+                subjects.update(triple[0] for triple in refreshed)
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM triples WHERE subject = ?", [(subject,) for subject in subjects]
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO triples (subject, predicate, object) VALUES (?, ?, ?)",
+                [triple[:3] for triple in triples],
+            )
+            if triples:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO syncs (scope, modified) VALUES (?, ?)",
+                    (scope, max(triple[3] for triple in triples)),
+                )
+        return len(subjects)
+
+    def __mirrored_members(self, collection):
+        return {
+            row[0] for row in self.connection.execute(
+                """SELECT subject FROM triples WHERE predicate = ? AND object = ?
+                UNION SELECT part.subject FROM triples AS part
+                JOIN triples AS member ON member.subject = part.object AND member.predicate = ? AND member.object = ?
+                WHERE part.predicate IN (?, ?)""",
+                (
+                    "info:fedora/fedora-system:def/relations-external#isMemberOfCollection",
+                    f"info:fedora/{collection}",
+                    "info:fedora/fedora-system:def/relations-external#isMemberOfCollection",
+                    f"info:fedora/{collection}",
+                    "info:fedora/fedora-system:def/relations-external#isConstituentOf",
+                    "http://islandora.ca/ontology/relsext#isPageOf",
+                ),
+            )
+        }
+
+    def __objects(self, subject, predicate):
+        return [
+            row[0] for row in self.connection.execute(
+                "SELECT object FROM triples WHERE subject = ? AND predicate = ?",
+                (f"info:fedora/{subject}", predicate),
+            )
+        ]
+
+    def __subjects(self, predicate, obj):
+        return {
+            row[0] for row in self.connection.execute(
+                "SELECT subject FROM triples WHERE predicate = ? AND object = ?", (predicate, obj)
+            )
+        }
+
+    def get_files(self, pid):
+        files = self.__objects(pid, "info:fedora/fedora-system:def/view#disseminates")
+        return [result.split('/')[-1] for result in files]
+
+    def get_images_no_parts(self, collection):
+        rows = self.connection.execute(
+            """SELECT model.subject FROM triples AS model
+            JOIN triples AS member ON member.subject = model.subject AND member.predicate = ? AND member.object = ?
+            WHERE model.predicate = ? AND model.object = ? AND NOT EXISTS (
+                SELECT 1 FROM triples AS part WHERE part.subject = model.subject AND part.predicate = ?
+            )""",
+            (
+                "info:fedora/fedora-system:def/relations-external#isMemberOfCollection",
+                f"info:fedora/{collection}",
+                "info:fedora/fedora-system:def/model#hasModel",
+                "info:fedora/islandora:sp_large_image_cmodel",
+                "info:fedora/fedora-system:def/relations-external#isConstituentOf",
+            ),
+        )
+        return [row[0].split('/')[-1] for row in rows]
+
+    def get_parent_collections(self, pid):
+        collections = self.__objects(pid, "info:fedora/fedora-system:def/relations-external#isMemberOfCollection")
+        return [result.split('/')[-1] for result in collections]
+
+    def get_members_types_and_collections(self, pid):
+        rows = self.connection.execute(
+            """SELECT member.subject, model.object, collection.object FROM triples AS member
+            JOIN triples AS model ON model.subject = member.subject AND model.predicate = ?
+            JOIN triples AS collection ON collection.subject = member.subject AND collection.predicate = ?
+            WHERE member.predicate = ? AND member.object = ?""",
+            (
+                "info:fedora/fedora-system:def/model#hasModel",
+                "info:fedora/fedora-system:def/relations-external#isMemberOfCollection",
+                "info:fedora/fedora-system:def/relations-external#isMemberOfCollection",
+                f"info:fedora/{pid}",
+            ),
+        )
+        return {
+            "results": [
+                {"pid": row[0], "work_type": row[1], "collection": row[2]} for row in rows
+            ]
+        }
+
+    def get_islandora_work_type(self, pid):
+        work_types = self.__objects(pid, "info:fedora/fedora-system:def/model#hasModel")
+        return [result for result in work_types if "info:fedora/fedora-system:FedoraObject-3.0" not in result][0]
+
+    def get_pid_based_on_page_number(self, parent, page):
+        pages = self.__subjects("http://islandora.ca/ontology/relsext#isPageOf", f"info:fedora/{parent}")
+        numbered = self.__subjects("http://islandora.ca/ontology/relsext#isPageNumber", str(page))
+        return [result.replace('info:fedora/', '') for result in pages & numbered][0]
+
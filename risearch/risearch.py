@@ -115,6 +115,52 @@ class ResourceIndexSearch:
         results = requests.get(f"{self.base_url}&query={query}").content.decode('utf-8')
         return [result.strip().replace('info:fedora/', '') for result in results.split('\n') if "pid" not in result][0]
 
+    def get_triples(self, namespace=None, collection=None, since=None, pids=None):
+        """Bulk dump the relationships of every object in a namespace or collection, or of a list of objects.
+
+        Dublin Core triples are left out since they are not relationships.  Only objects modified after since are
+        returned so that a mirror can be refreshed incrementally.
+        Args:
+            namespace (str): Limit results to objects in this namespace.
+            collection (str): Limit results to members of this collection and their parts and pages.
+            pids (list): Only return the relationships of these persistent identifiers.
+            since (str): An xsd:dateTime.  Only return objects modified after this.
+        Returns:
+            list: A list of (subject, predicate, object, last modified date) tuples.
+        Examples:
+            >>> ResourceIndexSearch(riformat="JSON").get_triples(namespace="test", since="2022-12-01T00:00:00Z")
+            [('info:fedora/test:1', 'info:fedora/fedora-system:def/model#hasModel', 'info:fedora/islandora:binaryObjectCModel', '2022-12-02T15:01:12.433Z')]
+        """
+        if self.language != "sparql" or self.format != "JSON":
+            raise Exception(
+                f"You must use sparql and JSON for this method.  You used {self.language} and {self.format}."
+            )
+        if namespace is None and collection is None and not pids:
+            raise Exception("You must specify a namespace, a collection, or pids.")
+        scope = ""
+        if collection is not None:
+            member = f"<info:fedora/fedora-system:def/relations-external#isMemberOfCollection> <info:fedora/{collection}>"
+            scope += (
+                f"{{ ?s {member} . }} UNION "
+                f"{{ ?s <info:fedora/fedora-system:def/relations-external#isConstituentOf> ?m . ?m {member} . }} UNION "
+                f"{{ ?s <http://islandora.ca/ontology/relsext#isPageOf> ?m . ?m {member} . }} "
+            )
+        if pids:
+            scope += f"FILTER({' || '.join(f'?s = <info:fedora/{pid}>' for pid in pids)}) "
+        if namespace is not None:
+            scope += f'FILTER(regex(str(?s), "^info:fedora/{namespace}:")) '
+        if since is not None:
+            scope += f'FILTER(?modified > "{since}"^^<http://www.w3.org/2001/XMLSchema#dateTime>) '
+        query = self.escape_query(
+            f"""SELECT DISTINCT ?s ?p ?o ?modified FROM <#ri> WHERE {{ ?s ?p ?o ; <info:fedora/fedora-system:def/view#lastModifiedDate> ?modified . {scope}}}"""
+        )
+        results = self.__request_json(query)
+        return [
+            (result['s'], result['p'], result['o'], result['modified'])
+            for result in results['results']
+            if not result['p'].startswith("http://purl.org/dc/elements/1.1/")
+        ]
+
 if __name__ == "__main__":
     pages_to_restrict = []
     pids_to_restrict = []
@@ -127,7 +173,7 @@ if __name__ == "__main__":
     for page in pages_to_restrict:
         pids_to_restrict.append(ResourceIndexSearch().get_pid_based_on_page_number(page[0], page[1]))
     with open('pages_to_restrict.txt', 'w') as output:
-        output.write(f"{}")
+        output.write("\n".join(pids_to_restrict))
 
 
 
@@ -0,0 +1,46 @@
+from risearch.mirror import LocalResourceIndexSearch
+from risearch.risearch import ResourceIndexSearch
+from argparse import ArgumentParser
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Mirror the resource index to a local SQLite database.")
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        dest="namespace",
+        help="Specify the namespace to mirror.",
+    )
+    parser.add_argument(
+        "-c",
+        "--collection",
+        dest="collection",
+        help="Specify the collection to mirror.",
+    )
+    parser.add_argument(
+        "-d",
+        "--database",
+        dest="database",
+        help="Specify the path to your SQLite database.",
+        default="risearch.db",
+    )
+    parser.add_argument(
+        "-s",
+        "--since",
+        dest="since",
+        help="Only sync objects modified after this xsd:dateTime.",
+    )
+    parser.add_argument(
+        "-r",
+        "--ri_endpoint",
+        dest="ri_endpoint",
+        help="Specify your resource index endpoint.",
+        default="https://porter.lib.utk.edu/fedora/risearch",
+    )
+    args = parser.parse_args()
+    if args.namespace is None and args.collection is None:
+        parser.error("You must specify a namespace or a collection.")
+    synced = LocalResourceIndexSearch(
+        database=args.database,
+        remote=ResourceIndexSearch(riformat="JSON", ri_endpoint=args.ri_endpoint),
+    ).sync(namespace=args.namespace, collection=args.collection, since=args.since)
+    print(f"Synced {synced} objects.")